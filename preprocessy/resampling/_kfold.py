@@ -24,7 +24,7 @@ class KFold:
     Private Methods
     ---------------
 
-    __iter_test_indices() : generator for getting mask of current fold that is going to be used as test set.
+    __iter_fold_bounds() : generator for getting the start and stop positions of each fold.
 
     Public Methods
     --------------
@@ -99,14 +99,22 @@ class KFold:
                 f" samples {n_samples}"
             )
 
-        indices = np.arange(n_samples)
-        for test_indices in self.__iter_test_indices(n_samples):
-            train_indices = indices[np.logical_not(test_indices)]
-            test_indices = indices[test_indices]
+        if self.shuffle:
+            rng = np.random.default_rng(self.random_state)
+            indices = rng.permutation(n_samples)
+        else:
+            indices = np.arange(n_samples)
+
+        for start, stop in self.__iter_fold_bounds(n_samples):
+            train_indices = np.concatenate((indices[:start], indices[stop:]))
+            test_indices = indices[start:stop]
             yield train_indices, test_indices
 
-    def __iter_test_indices(self, n_samples):
-        """Generate masked indices for the current fold that is going to serve as test set.
+    def __iter_fold_bounds(self, n_samples):
+        """Generate the start and stop positions of each fold.
+
+        The shared permutation is built once in split(); each fold only
+        slices it, so no per-fold mask or reshuffle is needed.
 
         Parameters
         ----------
@@ -116,26 +124,19 @@ class KFold:
         Yields
         ------
 
-        mask : ndarray Array of size n_samples. If a sample belongs to fold that is going to be the test set then mask has value 1 else 0.
+        start : int Position of the first sample of the fold.
 
-        """
-        if self.shuffle:
-            np.random.seed(self.random_state)
-            indices = np.random.permutation(n_samples)
-        else:
-            indices = np.arange(n_samples)
+        stop : int Position one past the last sample of the fold.
 
+        """
         fold_sizes = np.full(
             self.n_splits, n_samples // self.n_splits, dtype=int
         )
         fold_sizes[: n_samples % self.n_splits] += 1
         current = 0
         for fold_size in fold_sizes:
-            start, stop = current, current + fold_size
-            mask = np.zeros(n_samples, dtype=bool)
-            mask[indices[start:stop]] = True
-            yield mask
-            current = stop
+            yield current, current + fold_size
+            current += fold_size
 
     def get_n_splits(self):
         """Returns the number of splitting iterations in the cross-validator
@@ -1,7 +1,16 @@
+import math
+
 import numpy as np
 import pandas as pd
 
-from ..utils import num_of_samples
+_SENTINEL = object()
+
+# Above this row count the stratified splitter groups rows per class with
+# O(n) masking passes instead of one O(n log n) stable argsort, but only
+# while the class count stays small - each class costs a full pass over
+# the codes, so beyond roughly log2(n) classes the sort wins again.
+_STRATIFY_ARGSORT_MAX = 1_000_000
+_STRATIFY_MASKING_CLASSES_MAX = 16
 
 
 class Split:
@@ -12,6 +21,10 @@ class Split:
 
     __validate__input() : validates input received by train_test_split()
 
+    __take_frame() : gathers rows of the feature dataframe at the given positions
+
+    __stratified_split_indices() : builds per-class train and test index arrays for stratified splits
+
     Public Methods
     --------------
 
@@ -20,12 +33,14 @@ class Split:
     """
 
     def __init__(self):
-        self.df = None
         self.X = None
         self.y = None
         self.test_size = None
         self.train_size = None
+        self.stratify = False
+        self.as_array = False
         self.random_state = 69
+        self._test_cut = None
 
     def __validate_input(self):
 
@@ -71,7 +86,7 @@ class Split:
                 " type: pandas.core.frame.DataFrame"
             )
 
-        n_samples = num_of_samples(self.X)
+        n_samples = self.X.shape[0]
 
         if self.y is not None:
             if n_samples != self.y.shape[0]:
@@ -86,27 +101,21 @@ class Split:
                     " type: pandas.core.series.Series"
                 )
         if self.test_size and self.train_size:
-            if not isinstance(self.test_size, int) or not isinstance(
-                self.test_size, float
-            ):
+            size_type = type(self.test_size)
+            if size_type not in (int, float):
                 raise TypeError("test_size must be of type int or float")
-            if not isinstance(self.train_size, int) or not isinstance(
-                self.train_size, float
-            ):
+            if type(self.train_size) not in (int, float):
                 raise TypeError("train_size must be of type int or float")
-            if not isinstance(self.test_size, self.train_size):
+            if type(self.train_size) is not size_type:
                 raise TypeError(
                     "Data types of test_size and train_size do not"
                     f" match.\ntest_size: {type(self.test_size)}.\ntrain_size:"
                     f" {type(self.train_size)}"
                 )
-            if (
-                isinstance(self.test_size, float)
-                and self.test_size + self.train_size != 1
-            ):
+            if size_type is float and self.test_size + self.train_size != 1:
                 raise ValueError("test_size + train_size should be equal to 1")
             elif (
-                isinstance(self.test_size, int)
+                size_type is int
                 and self.test_size + self.train_size != n_samples
             ):
                 raise ValueError(
@@ -153,12 +162,123 @@ class Split:
                 self.train_size = 0.8
             else:
                 features = len(self.X.columns)
-                self.test_size = float(1 / np.sqrt(features))
-                self.train_size = 1 - self.test_size
+                self.test_size = 1.0 / math.sqrt(features)
+                self.train_size = 1.0 - self.test_size
+
+        if not isinstance(self.stratify, bool):
+            raise TypeError("stratify should be of type bool")
+
+        if not isinstance(self.as_array, bool):
+            raise TypeError("as_array should be of type bool")
+
+        if self.stratify and self.y is None:
+            raise ValueError("stratify requires a target label to be provided")
+
+        if self.stratify and self.y.hasnans:
+            raise ValueError(
+                "stratify requires a target label without null values"
+            )
 
         if not isinstance(self.random_state, int):
             raise TypeError("random_state should be of type int")
 
+        self._test_cut = (
+            int(self.test_size * n_samples)
+            if isinstance(self.test_size, float)
+            else int(self.test_size)
+        )
+
+    def __take_frame(self, idx):
+        """Gather rows of the feature dataframe at the given positions.
+
+        A frame with a single numpy dtype is backed by one 2D block, so
+        its rows are gathered with one NumPy fancy-indexing pass over the
+        exported array and rewrapped without a copy. Mixed-dtype frames
+        and frames holding extension dtypes, which to_numpy would degrade
+        to object, fall back to DataFrame.take.
+
+        Parameters
+        ----------
+
+        idx : ndarray Row positions to gather.
+
+        Returns
+        -------
+
+        frame : pandas.core.frames.DataFrame Rows of X at the given positions.
+
+        """
+        dtypes = self.X.dtypes
+        if dtypes.nunique() == 1 and isinstance(dtypes.iloc[0], np.dtype):
+            arr = self.X.to_numpy(copy=False)
+            return pd.DataFrame(
+                arr[idx],
+                index=self.X.index.take(idx),
+                columns=self.X.columns,
+                copy=False,
+            )
+        return self.X.take(idx, axis=0)
+
+    def __stratified_split_indices(self, rng, n_samples):
+        """Build train and test index arrays that preserve the class
+        proportions of the target label.
+
+        Groups row positions by class, shuffles each class slice
+        independently and carves the test rows off every class before
+        joining the per-class arrays once with np.concatenate. Rows are
+        grouped with a single stable argsort, except for very large
+        inputs with few classes, where one vectorized masking pass per
+        class is cheaper than the O(n log n) sort.
+
+        Parameters
+        ----------
+
+        rng : numpy.random.Generator
+            Generator used for the per-class shuffles.
+
+        n_samples : int Number of samples in the dataset
+
+        Returns
+        -------
+
+        train_idx : ndarray Row positions for the train set.
+
+        test_idx : ndarray Row positions for the test set.
+
+        """
+        codes, uniques = pd.factorize(self.y.values)
+        n_classes = len(uniques)
+        if (
+            n_samples > _STRATIFY_ARGSORT_MAX
+            and n_classes <= _STRATIFY_MASKING_CLASSES_MAX
+        ):
+            class_groups = [
+                np.flatnonzero(codes == code) for code in range(n_classes)
+            ]
+        else:
+            order = np.argsort(codes, kind="stable").astype(
+                np.intp, copy=False
+            )
+            bounds = np.searchsorted(codes[order], np.arange(n_classes + 1))
+            class_groups = [
+                order[start:stop]
+                for start, stop in zip(bounds[:-1], bounds[1:])
+            ]
+        test_frac = (
+            self.test_size
+            if isinstance(self.test_size, float)
+            else self.test_size / n_samples
+        )
+        train_parts = []
+        test_parts = []
+        for class_idx in class_groups:
+            class_n = class_idx.shape[0]
+            class_idx = class_idx[rng.permutation(class_n)]
+            cut = int(round(test_frac * class_n))
+            test_parts.append(class_idx[:cut])
+            train_parts.append(class_idx[cut:])
+        return np.concatenate(train_parts), np.concatenate(test_parts)
+
     def train_test_split(self, params):
         """Performs train test split on the input data
 
@@ -179,6 +299,15 @@ class Split:
             Size of train set after splitting. Can take values from 0 - 1 for float point values,
             0 - Number of samples for integer values. Is complementary to test size.
 
+        stratify : bool
+            If True, the split preserves the class proportions of the target
+            label in both sets. Requires y to be provided.
+
+        as_array : bool
+            If True, the train and test sets are returned as numpy.ndarray
+            instead of pandas objects, skipping the DataFrame materialization
+            for callers that feed arrays straight into estimators.
+
         random_state : int
             Seeding to be provided for shuffling before splitting.
 
@@ -203,51 +332,57 @@ class Split:
 
         """
 
-        if "X" in params.keys():
-            self.X = params["X"]
-        if "y" in params.keys():
-            self.y = params["y"]
-        if "test_size" in params.keys():
-            self.test_size = params["test_size"]
-        if "train_size" in params.keys():
-            self.train_size = params["train_size"]
-        if "random_state" in params.keys():
-            self.random_state = params["random_state"]
+        for key in (
+            "X",
+            "y",
+            "test_size",
+            "train_size",
+            "stratify",
+            "as_array",
+            "random_state",
+        ):
+            value = params.get(key, _SENTINEL)
+            if value is not _SENTINEL:
+                setattr(self, key, value)
 
         self.__validate_input()
 
-        np.random.seed(self.random_state)
+        rng = np.random.default_rng(self.random_state)
 
-        if self.y is not None:
-            self.df = pd.concat([self.X, self.y], axis=1)
-        else:
-            self.df = self.X
-
-        self.df = self.df.iloc[
-            np.random.permutation(len(self.df))
-        ].reset_index(drop=True)
-        if isinstance(self.test_size, float):
-            index = int(self.test_size * len(self.df))
-            train = self.df.iloc[index:]
-            test = self.df.iloc[:index]
+        n_samples = self.X.shape[0]
+
+        if self.stratify:
+            train_idx, test_idx = self.__stratified_split_indices(
+                rng, n_samples
+            )
         else:
-            train = self.df.iloc[self.test_size :]
-            test = self.df.iloc[: self.test_size]
+            idx = rng.permutation(n_samples).astype(np.intp, copy=False)
+            cut = self._test_cut
+            test_idx, train_idx = idx[:cut], idx[cut:]
 
         if self.y is not None:
-            if not self.y.name:
-                raise ValueError(
-                    f"Target column needs to have a name. ${self.y.name} was provided."
-                )
-            y_train = train[self.y.name]
-            X_train = train.drop([self.y.name], axis=1)
-            y_test = test[self.y.name]
-            X_test = test.drop([self.y.name], axis=1)
-            params["X_train"] = X_train
-            params["X_test"] = X_test
-            params["y_train"] = y_train
-            params["y_test"] = y_test
+            if self.as_array:
+                X_arr = self.X.to_numpy(copy=False)
+                y_arr = self.y.to_numpy(copy=False)
+                params["X_train"] = X_arr[train_idx]
+                params["X_test"] = X_arr[test_idx]
+                params["y_train"] = y_arr[train_idx]
+                params["y_test"] = y_arr[test_idx]
+            else:
+                X_train = self.__take_frame(train_idx)
+                X_test = self.__take_frame(test_idx)
+                y_train = self.y.take(train_idx)
+                y_test = self.y.take(test_idx)
+                params["X_train"] = X_train
+                params["X_test"] = X_test
+                params["y_train"] = y_train
+                params["y_test"] = y_test
+
+        elif self.as_array:
+            X_arr = self.X.to_numpy(copy=False)
+            params["train"] = X_arr[train_idx]
+            params["test"] = X_arr[test_idx]
 
         else:
-            params["train"] = train
-            params["test"] = test
+            params["train"] = self.__take_frame(train_idx)
+            params["test"] = self.__take_frame(test_idx)
@@ -16,6 +16,26 @@ class TestSplitting:
         assert params["test"].shape[0] == 20
         assert params["test"].shape[1] == 10
 
+    def test_with_both_sizes(self):
+        df = pd.DataFrame(np.arange(1000).reshape(100, 10))
+        params = {
+            "X": df,
+            "train_size": 0.8,
+            "test_size": 0.2,
+            "random_state": 420,
+        }
+        split = Split()
+        split.train_test_split(params=params)
+        assert params["train"].shape[0] == 80
+        assert params["test"].shape[0] == 20
+
+    def test_size_type_mismatch(self):
+        df = pd.DataFrame(np.arange(1000).reshape(100, 10))
+        with pytest.raises(TypeError):
+            params = {"X": df, "train_size": 0.8, "test_size": 20}
+            split = Split()
+            split.train_test_split(params=params)
+
     def test_random_state(self):
         df = pd.DataFrame(np.arange(1000).reshape(100, 10))
         # test passes if function raises a TypeError
@@ -24,15 +44,77 @@ class TestSplitting:
             split = Split()
             split.train_test_split(params=params)
 
-    def test_without_target_label(self):
+    def test_stratified_split(self):
         df_x = pd.DataFrame(np.arange(1000).reshape(100, 10))
-        df_y = pd.Series(np.arange(100))
+        df_y = pd.Series([0] * 80 + [1] * 20, name="label")
+        params = {
+            "X": df_x,
+            "y": df_y,
+            "test_size": 0.25,
+            "random_state": 420,
+            "stratify": True,
+        }
+        split = Split()
+        split.train_test_split(params=params)
+        assert params["X_test"].shape[0] == 25
+        assert (params["y_test"] == 1).sum() == 5
+        assert (params["y_train"] == 1).sum() == 15
+
+    def test_stratify_with_null_target(self):
+        df_x = pd.DataFrame(np.arange(1000).reshape(100, 10))
+        df_y = pd.Series([0.0] * 80 + [np.nan] * 20, name="label")
         with pytest.raises(ValueError):
             params = {
                 "X": df_x,
                 "y": df_y,
-                "test_size": 0.2,
+                "stratify": True,
                 "random_state": 420,
             }
             split = Split()
             split.train_test_split(params=params)
+
+    def test_stratify_without_target(self):
+        df = pd.DataFrame(np.arange(1000).reshape(100, 10))
+        with pytest.raises(ValueError):
+            params = {"X": df, "stratify": True, "random_state": 420}
+            split = Split()
+            split.train_test_split(params=params)
+
+    def test_extension_dtypes_preserved(self):
+        df = pd.DataFrame(np.arange(1000).reshape(100, 10)).astype("Int64")
+        params = {"X": df, "test_size": 0.2, "random_state": 420}
+        split = Split()
+        split.train_test_split(params=params)
+        assert (params["train"].dtypes == "Int64").all()
+        assert (params["test"].dtypes == "Int64").all()
+
+    def test_as_array(self):
+        df_x = pd.DataFrame(np.arange(1000).reshape(100, 10))
+        df_y = pd.Series(np.arange(100), name="label")
+        params = {
+            "X": df_x,
+            "y": df_y,
+            "test_size": 0.2,
+            "random_state": 420,
+            "as_array": True,
+        }
+        split = Split()
+        split.train_test_split(params=params)
+        assert isinstance(params["X_train"], np.ndarray)
+        assert params["X_train"].shape == (80, 10)
+        assert isinstance(params["y_test"], np.ndarray)
+        assert params["y_test"].shape == (20,)
+
+    def test_unnamed_target_label(self):
+        df_x = pd.DataFrame(np.arange(1000).reshape(100, 10))
+        df_y = pd.Series(np.arange(100))
+        params = {
+            "X": df_x,
+            "y": df_y,
+            "test_size": 0.2,
+            "random_state": 420,
+        }
+        split = Split()
+        split.train_test_split(params=params)
+        assert params["X_train"].shape[0] == 80
+        assert params["y_test"].shape[0] == 20